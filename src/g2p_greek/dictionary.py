@@ -1,54 +1,115 @@
 #!/usr/bin/env python3
 
-import fileinput
+# NOTE: Do not try to speed this module up with numba/cython. Loading the lexicon is file parsing and
+#       lookups are single probes in a flat dict, neither of which a JIT compiler can improve on.
+
+import hashlib
+import marshal
+import os
 import warnings
+from tempfile import NamedTemporaryFile
 
 from g2p_greek.phoneme_conversion import convert_word
 from g2p_greek.rules import single_letter_pronounciations
 from g2p_greek.english_rules import english_mappings
 
 
+# Pronunciations of single letters. The greek letters take precedence over the latin ones.
+_single_letter_mappings = {**english_mappings, **single_letter_pronounciations}
+
+# Bump this when the layout of the lexicon dict changes, so that old caches are not used
+_cache_format_version = 1
+
+
+def default_lexicon_cache_dir() -> str:
+    """ The per user directory where the parsed lexicons are cached (e.g. ~/.cache/g2p_greek). """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "g2p_greek")
+
+
 class Dictionary(object):
-    def __init__(self, path_to_lexicon, N=3):
-        self.lexicon_dict = self._lexicon_lookup(path_to_lexicon, N=N)
-        self.N = 3  # Hash map key length
+    def __init__(self, path_to_lexicon, N=3, cache_dir=None):
+        """ Args:
+                path_to_lexicon: The path to the lexicon (e.g. el-gr.dic).
+                N: Only kept for backwards compatibility (see below).
+                cache_dir: If given, the parsed lexicon is cached in this directory (e.g. the one returned by
+                           default_lexicon_cache_dir) so that the next runs do not have to parse it again.
+                           If None (default) the lexicon is parsed every time and nothing is written.
+        """
+        self.lexicon_dict = self._load_lexicon(path_to_lexicon, cache_dir)
+        # N used to be the length of the prefix bucket keys. The lexicon is now keyed on the full word,
+        # so it is only kept (matching the argument) for backwards compatibility.
+        self.N = N
+
+    @classmethod
+    def _load_lexicon(cls, path_to_lexicon: str, cache_dir: str = None):
+        if cache_dir is None:
+            return cls._lexicon_lookup(path_to_lexicon)
+        # Parsing the whole lexicon is slow, so the parsed dict may be cached (opt-in). The cache is stored
+        # with marshal (loading it cannot execute code) and it is only used if its header matches the
+        # lexicon file that it was created from, and the file belongs to the current user.
+        path_to_lexicon = os.path.abspath(path_to_lexicon)
+        lexicon_stat = os.stat(path_to_lexicon)
+        header = (_cache_format_version, path_to_lexicon, lexicon_stat.st_size, lexicon_stat.st_mtime_ns)
+        cache_path = os.path.join(cache_dir, hashlib.sha256(path_to_lexicon.encode("utf-8")).hexdigest() + ".lexicon")
+        try:
+            with open(cache_path, "rb") as fr:
+                if hasattr(os, "getuid") and os.fstat(fr.fileno()).st_uid != os.getuid():
+                    raise OSError("The lexicon cache is owned by another user: {}".format(cache_path))
+                cached = marshal.loads(fr.read())
+            if isinstance(cached, tuple) and len(cached) == 2 and cached[0] == header and isinstance(cached[1], dict):
+                return cached[1]
+        except (OSError, EOFError, ValueError, TypeError):
+            pass  # missing, unreadable or corrupted cache
+        lexicon_dict = cls._lexicon_lookup(path_to_lexicon)
+        try:
+            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+            # Write to a temporary file first so that other processes never read a half written cache
+            with NamedTemporaryFile("wb", dir=cache_dir, suffix=".tmp", delete=False) as fw:
+                try:
+                    marshal.dump((header, lexicon_dict), fw)
+                    fw.close()
+                    os.replace(fw.name, cache_path)
+                except BaseException:
+                    # Do not leave a (lexicon sized) temporary file behind
+                    fw.close()
+                    os.unlink(fw.name)
+                    raise
+        except (OSError, ValueError) as e:
+            warnings.warn("Could not cache the lexicon in {}: {}".format(cache_dir, e), RuntimeWarning)
+        return lexicon_dict
 
     @staticmethod
-    def _lexicon_lookup(path_to_lexicon: str, N=3):
-        # Implement a hash lookup keeping N characters as the key
+    def _lexicon_lookup(path_to_lexicon: str):
+        # A flat hash map from each word to its phonemes (the dict is already hashed on the full word)
         # IMPORTANT: all words in the lexicon file must be unique (appear only once in the file)
         lexicon_dict: dict = {}
-        for line in fileinput.input([path_to_lexicon], openhook=fileinput.hook_encoded("utf-8")):
-            word = str(line.split()[0]).strip()
-            phonemes = " ".join(line.split()[1:]).replace("\n", "").strip()
-            # Keep N characters if word is at least of length N
-            key = word if len(word) <= N else word[:N]
-            if key in lexicon_dict.keys():
-                lexicon_dict[key][word] = phonemes
-            else:
-                # Each lexicon dict value will be a dictionary with word -> phonemes
-                lexicon_dict[key] = {word: phonemes}
+        with open(path_to_lexicon, "r", encoding="utf-8") as fr:
+            for line in fr:
+                # Split only once: the word is the first token and the rest of the line are the phonemes
+                parts = line.split(maxsplit=1)
+                if not parts:
+                    continue  # empty line
+                word = parts[0]
+                phonemes = parts[1].strip() if len(parts) > 1 else ""
+                lexicon_dict[word] = phonemes
         return lexicon_dict
 
     def get_word_phonemes(self, word, initial_word=None):
         if initial_word is None:
             initial_word = word
         if len(word.strip()) == 1:
-            try:
-                return initial_word + " " + " ".join(convert_word(single_letter_pronounciations[word])[1]) + "\n"
-            except KeyError:
-                try:
-                    return initial_word + " " + " ".join(convert_word(english_mappings[word])[1]) + "\n"
-                except KeyError:
-                    warnings.warn("The single letter word {} could not be converted.".format(word), RuntimeWarning)
-                    return initial_word + " \n"
-        key = word[:self.N]
-        if key in self.lexicon_dict.keys():
-            if word in self.lexicon_dict[key].keys():
-                current_phones = self.lexicon_dict[key][word].split()
-            else:
-                _, current_phones = convert_word(word)  # Get word and phonemes
+            pronunciation = _single_letter_mappings.get(word)
+            if pronunciation is None:
+                warnings.warn("The single letter word {} could not be converted.".format(word), RuntimeWarning)
+                return initial_word + "\n"
+            phonemes = " ".join(convert_word(pronunciation)[1])
         else:
-            _, current_phones = convert_word(word)  # Get word and phonemes
-        out = initial_word + " " + " ".join(current_phones) + "\n"  # append new line at the end
-        return out
+            # The lexicon phonemes are kept as a single space separated string, so they can be used as they are
+            phonemes = self.lexicon_dict.get(word)
+            if phonemes is None:
+                _, current_phones = convert_word(word)  # Get word and phonemes
+                phonemes = " ".join(current_phones)
+        if not phonemes:
+            return initial_word + "\n"
+        return initial_word + " " + phonemes + "\n"  # append new line at the end
@@ -20,17 +20,24 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+# NOTE: Do not try to speed this module up with numba/cython. Everything here is string building and
+#       dict lookups, which numba can only run in object mode (usually slower than plain python).
+#       The conversions are already table lookups (see _WORDS_0_999) and convert_numbers is memoized.
+
 import argparse
 
 import sys
 
 import os
 import glob
-from tempfile import mkstemp
-from shutil import move
+from pathlib import Path
+from tempfile import NamedTemporaryFile
 
 import re
-from g2p_greek.utils import process_word, handle_commas, punctuation
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from g2p_greek.utils import handle_commas
 from g2p_greek.prefixes import _prefixes
 import warnings
 
@@ -41,251 +48,153 @@ warnings.warn("Important: digits_to_words.py has been deprecated."
               " The current version may contain some bugs and so you should probably install Numbers2Words-Greek. Use at your own risk.", DeprecationWarning)
 
 
-to_plural = lambda word: re.sub("ερα", "ερις", re.sub("τρία", "τρείς", word))  # for 13 and 14 special cases in plural
+def to_plural(word: str) -> str:
+    # for 13 and 14 special cases in plural (plain substrings, so no need for regular expressions)
+    return word.replace("τρία", "τρείς").replace("ερα", "ερις")
+
+
+# Bind the prefix tables once instead of looking them up in _prefixes on every call
+_P1 = _prefixes['1digit']
+_P4 = _prefixes['4digit']
+_P6 = _prefixes['6digit']
+
 
-def _check_input(number: str, length: int, operator: str = None):
-    """ This function checks the validity of the inputs.
+def _join_words(*words: str) -> str:
+    """ Join the non-empty words with a single space (e.g. a trailing all-zero group adds nothing).
         Args:
-            number: The number which we want to check (must be a string)
-            length: The length of the number (how many digits it is allowed to have)
-            operator: There are 3 choices:
-                      1. None (default): Then there must be as many digits as the length argument (equation)
-                      2. greater_equal (or ge): Then there must be at list *length* digits in the number
-                      3. less_equal (or le): Then there must be at most *length* digits in the number
+            words: The words (or groups of words) that make up the number.
+        Returns:
+            The space separated words, without leading or trailing spaces.
     """
-    # Check input
-    assert isinstance(number, str), "Input must be as string."
-    if operator in ["greater_equal", "ge"]:
-        assert len(number) >= length, "The digit must contain more than " + str(length) + " digits."
-    elif operator in ["less_equal", "le"]:
-        assert len(number) <= length, "The digit must contain less than " + str(length) + " digits."
-    else:
-        assert len(number) == length, "The digit must contain " + str(length) + " digits."
+    return " ".join(word for word in words if word)
+
+
+def _build_words_0_999() -> tuple:
+    """ Spell out every integer from 0 to 999 once, so that the short conversions become a single index.
+        Note that index 0 maps to "" (an all-zero group is not pronounced), while "0" on its own is
+        handled by _convert_1digit.
+        Returns:
+            A tuple of 1000 strings where the i-th element is the greek word for i.
+    """
+    ones, tens, hundreds = _prefixes['1digit'], _prefixes['2digit'], _prefixes['3digit']
+    words = [""] + [ones[str(i)] for i in range(1, 10)]
+    for i in range(10, 100):
+        key = str(i)
+        # E.g. 10 -> "δέκα" but 13 -> "δεκα" + "τρία" = "δεκατρία"
+        words.append(tens[key] if key in tens else tens[key[0]] + ones[key[1]])
+    for i in range(100, 1000):
+        key = str(i)
+        # E.g. 300 -> "τριακόσια" but 387 -> "τριακοσια" + " " + "ογδονταεφτά"
+        words.append(hundreds[key] if key in hundreds else hundreds[key[0]] + " " + words[i % 100])
+    return tuple(words)
+
+
+_WORDS_0_999 = _build_words_0_999()
+_WORDS_0_99 = _WORDS_0_999[:100]
+# Plural form of every entry above, used when a group is followed by "χιλιάδες" (e.g. δεκατρείς χιλιάδες)
+_PLURAL = {word: to_plural(word) for word in _WORDS_0_999}
+
+
+def _build_thousands_0_999() -> tuple:
+    """ Spell out every multiple of 1000 from 0 to 999000, so that numbers of up to 6 digits only need two lookups.
+        Returns:
+            A tuple of 1000 strings where the i-th element is the greek word for i thousands.
+    """
+    # 1000 -> "χίλια", 2000 -> "δυο χιλιάδες", ...
+    thousands = [""] + [_P4[str(i)] for i in range(1, 10)]
+    for i in range(10, 1000):
+        key = str(i) + "000"
+        # E.g. 200000 -> "διακόσιες χιλιάδες" but 13000 -> "δεκατρείς χιλιάδες"
+        thousands.append(_P6[key] if key in _P6 else _PLURAL[_WORDS_0_999[i]] + " χιλιάδες")
+    return tuple(thousands)
+
+
+_THOUSANDS_0_999 = _build_thousands_0_999()
 
 
 def _convert_1digit(number: str) -> str:
-    _check_input(number, 1)
-    if number not in _prefixes['1digit'].keys():
+    if number not in _P1:
         raise ValueError("Digit", number, "is not a valid number.")
-    out = _prefixes['1digit'][number]
+    out = _P1[number]
     return out
 
 
 def _convert_2digit(number: str) -> str:
-    _check_input(number, 2)
-    if number in _prefixes['2digit'].keys():  # so if it is 10 then return 'δέκα' (same for 11, 12 , 20, ..., 90)
-        return _prefixes['2digit'][number]
-    first_digit = number[0]  # e.g. from 15 keep only 1
-    # Special case
-    temp_num = number
-    for index, sub_digit in enumerate(number):
-        if sub_digit == "0":
-            temp_num = number[index + 1:]
-        else:
-            break
-    number = temp_num
-    if len(number) == 1:
-        return _convert_1digit(number)  # If we had something like 01 then return the word for 1
-    elif len(number) == 0:
-        return ""  # If we had 00 then return nothing
-    # Make sure that the 1st digit exists in the dictionary
-    if first_digit not in _prefixes['2digit'].keys():
-        raise ValueError("Invalid start:", first_digit, ". Occurred while converting the 2 digit number, ", number)
-    # Return the 2 digit start and then call the _convert_1digit to convert the second number
-    # E.g. 13 will become "δεκα" + "τρία" = "δεκατρία"
-    out = _prefixes['2digit'][first_digit] + _convert_1digit(number[1])
-    return out.strip()
+    # Leading zeros are handled by int(), e.g. 01 -> "ένα" and 00 -> ""
+    return _WORDS_0_99[int(number)]
 
 
 def _convert_3digit(number: str) -> str:
-    _check_input(number, 3)
-    if number in _prefixes['3digit'].keys():  # E.g. if we have 300 then just return "τριακόσια"
-        return _prefixes['3digit'][number]
-    # Special case
-    temp_num = number
-    for index, sub_digit in enumerate(number):
-        if sub_digit == "0":
-            temp_num = number[index + 1:]
-        else:
-            break
-    number = temp_num
-    if len(number) == 2:
-        return _convert_2digit(number)  # If we had something like 012 then return the word for 12
-    elif len(number) == 1:
-        return _convert_1digit(number)  # If we had something like 001 then return the word for 1
-    elif len(number) == 0:
-        return ""  # If we had 00 then return nothing
-    first_digit = number[0]  # e.g. from 387 keep 3
-    # if first_digit == "0":
-    #     return ""
-    if first_digit not in _prefixes['3digit'].keys():
-        raise ValueError("Invalid start:", first_digit, ". Occurred while converting the 3 digit number, ", number)
-    # Return the 3 digit prefix and then the 2 digit prefix
-    # E.g. for 387 return "τριακοσια" + " " + "ογδονταεφτά" = "τριακόσια ογδονταεφτά"
-    out = _prefixes['3digit'][first_digit] + " " + _convert_2digit(number[1:])
-    return out.strip()
-
-
-def _convert_4digit(number: str) -> str:
-    _check_input(number, 4)
-    if number in _prefixes['4digit'].keys():  # E.g. if we have 7000 then just return "εφτά χιλιάδες"
-        return _prefixes['4digit'][number]
-    first_digit = number[0]  # e.g. from 7879 keep 7
-    # Special case
-    temp_num = number
-    for index, sub_digit in enumerate(number):
-        if sub_digit == "0":
-            temp_num = number[index + 1:]
-        else:
-            number = temp_num
-            break
-    if len(number) == 3:
-        return _convert_3digit(number)  # If we had something like 0112 then return the word for 112
-    elif len(number) == 2:
-        return _convert_2digit(number)  # If we had something like 0012 then return the word for 12
-    elif len(number) == 1:
-        return _convert_1digit(number)  # If we had something like 0001 then return the word for 1
-    elif len(number) == 0:
-        return ""  # If we had 00 then return nothing
-    # if first_digit == "0":
-    #     return ""
-    if first_digit not in _prefixes['4digit'].keys():
-        raise ValueError("Invalid start:", first_digit, ". Occurred while converting the 4 digit number, ", number)
-    # Return the 4 digit prefix and then the 4 digit prefix
-    # E.g. for 7879 return "εφτά χιλιάδες" + " " + "οχτακόσια εβδομηνταεννιά" = "εφτά χιλιάδες οχτακόσια εβδομηνταεννιά"
-    out = _prefixes['4digit'][first_digit] + " " + _convert_3digit(number[1:])
-    return out.strip()
-
-
-def _convert_5digit(number: str) -> str:
-    _check_input(number, 5)
-    if number in _prefixes['5digit'].keys():  # E.g. if we have 40000 then just return "σαράντα χιλιάδες"
-        return _prefixes['5digit'][number]
-    # Special case
-    temp_num = number
-    for index, sub_digit in enumerate(number):
-        if sub_digit == "0":
-            temp_num = number[index + 1:]
-        else:
-            number = temp_num
-            break
-    if len(number) == 4:
-        return _convert_4digit(number)  # If we had something like 01112 then return the word for 1112
-    if len(number) == 3:
-        return _convert_3digit(number)  # If we had something like 00112 then return the word for 112
-    elif len(number) == 2:
-        return _convert_2digit(number)  # If we had something like 00012 then return the word for 12
-    elif len(number) == 1:
-        return _convert_1digit(number)  # If we had something like 00001 then return the word for 1
-    elif len(number) == 0:
-        return ""  # If we had 00 then return nothing
-    # At first find the 2 digit prefix -> e.g. from 89898 get the word for 89
-    # Special case 13 and 14 where there needs to be a certain plural form (δεκατρείς χιλιάδες instead of δεκατρία).
-    # Then append the word "χιλιάδες"
-    # Then append the 3 digit leftover from _convert_3digit -> e.g. from 78123 get the word for 123
-    out = to_plural(_convert_2digit(number[:2])) + " χιλιάδες " + _convert_3digit(number[2:])
-    return out.strip()
+    # Leading zeros are handled by int(), e.g. 012 -> "δώδεκα" and 000 -> ""
+    return _WORDS_0_999[int(number)]
 
 
 def _convert_6digit(number: str) -> str:
-    _check_input(number, 6)
-    if number in _prefixes['6digit'].keys():  # E.g. if we have 400000 then just return "σαράντα χιλιάδες"
-        return _prefixes['6digit'][number]
-    # Special case
-    temp_num = number
-    for index, sub_digit in enumerate(number):
-        if sub_digit == "0":
-            temp_num = number[index + 1:]
-        else:
-            break
-    number = temp_num
-    if len(number) == 5:
-        return _convert_5digit(number)  # If we had something like 012112 then return the word for 12112
-    if len(number) == 4:
-        return _convert_4digit(number)  # If we had something like 001112 then return the word for 1112
-    if len(number) == 3:
-        return _convert_3digit(number)  # If we had something like 000112 then return the word for 112
-    elif len(number) == 2:
-        return _convert_2digit(number)  # If we had something like 000012 then return the word for 12
-    elif len(number) == 1:
-        return _convert_1digit(number)  # If we had something like 000001 then return the word for 1
-    elif len(number) == 0:
-        return ""  # If we had 00 then return nothing
-    # Steps:
-    # 1. Check if the number is in the form 000000 (can happen). If so then return nothing
-    # 2. At first find the 3 digit prefix -> e.g. from 131789 get the word for 131
-    # 3. Special case *13 and *14 where there needs to be a certain plural form (δεκατρείς χιλιάδες instead of δεκατρία)
-    # 4. Then append the word "χιλιάδες"
-    # 5. Then append the 3 digit leftover from _convert_3digit -> e.g. from 131789 get the word for 789
-    last_3_digits = _convert_3digit(number[3:])
-    if number[:3] == "000":
-        return last_3_digits  # e.g. if input is 000183 return εκατόν ογδοντατρία
-    first_3_digits = to_plural(_convert_3digit(number[:3]))
-    out = first_3_digits + " χιλιάδες " + last_3_digits
-    return out.strip()
-
-
-def _convert_more_than7_less_than10_digits(number: str) -> str:
-    # From 1000000 (1 million) to 1000000000 (1 billion)
-    _check_input(number, 7, operator="greater_equal")
-    _check_input(number, 9, operator="less_equal")
-    # There is one special case since 1000000 (1 million) wants singular form
-    if len(number) == 7 and number[0] == "1":
-        out = "ένα εκατομμύριο " + _convert_6digit(number[1:])
-        return out
-    # --------------------------------- SPECIAL CASE ----------------------------------
-    # Special case: if called from a larger number then there is a possibility to have all zeroes
-    # E.g. for 3 billion we are going to have a 3 and 9 zeroes after that. We don't want to append "εκκατομυριο" to that
-    temp_num = number
-    for index, sub_digit in enumerate(number):
-        if sub_digit == "0":
-            temp_num = number[index + 1:]  # e.g. if number=0010000 then it will be converted to 10000
-        else:
-            break
-    number = temp_num
-    # number = re.sub("0", "", temp_num)
-    if len(number) == 6:
-        out = _convert_6digit(number)
-    elif len(number) == 5:
-        out = _convert_5digit(number)
-    elif len(number) == 4:
-        out = _convert_4digit(number)
-    elif len(number) == 3:
-        out = _convert_3digit(number)
-    elif len(number) == 2:
-        out = _convert_2digit(number)
-    elif len(number) == 1:
-        out = _convert_1digit(number)
-    elif len(number) == 0:
-        return ""
-    # --------------------------------- END SPECIAL CASE ----------------------------------
-
-    if len(number) == 7:
-        out = _convert_1digit(number[0]) + " εκατομμύρια " + _convert_6digit(number[1:])
-    elif len(number) == 8:
-        out = _convert_2digit(number[:2]) + " εκατομμύρια " + _convert_6digit(number[2:])
-    elif len(number) == 9:
-        out = _convert_3digit(number[:3]) + " εκατομμύρια " + _convert_6digit(number[3:])
-    return out.strip()
-
-
-def _convert_more_than10_less_than13_digits(number: str) -> str:
-    # From 1 billion to 1 trillion
-    _check_input(number, 10, operator="greater_equal")
-    _check_input(number, 12, operator="less_equal")
-    # There is one special case since 1000000 (1 million) wants singular form
-    if len(number) == 10 and number[0] == "1":
-        out = "ένα δισεκατομμύριο " + _convert_more_than7_less_than10_digits(number[1:])
-        return out
-    if len(number) == 10:
-        out = _convert_1digit(number[0]) + " δισεκατομμύρια " + _convert_more_than7_less_than10_digits(number[1:])
-    elif len(number) == 11:
-        out = _convert_2digit(number[:2]) + " δισεκατομμύρια " + _convert_more_than7_less_than10_digits(number[2:])
-    elif len(number) == 12:
-        out = _convert_3digit(number[:3]) + " δισεκατομμύρια " + _convert_more_than7_less_than10_digits(number[3:])
-    return out.strip()
+    # Any number of up to 6 digits is its thousands group followed by the last 3 digits.
+    # E.g. for 131789 return "εκατόν τριανταένα χιλιάδες" + " " + "εφτακόσια ογδονταεννιά"
+    # Leading zeros are handled by int(), e.g. 000183 -> "εκατόν ογδοντατρία" and 000000 -> ""
+    thousands, rest = divmod(int(number), 1000)
+    return _join_words(_THOUSANDS_0_999[thousands], _WORDS_0_999[rest])
+
+
+# The 4 and 5 digit numbers need no special handling (they are 6 digit numbers with leading zeros)
+_convert_4digit = _convert_5digit = _convert_6digit
 
 
+# The scales above the thousands: (number of digits below the scale, singular form, plural suffix)
+_LARGE_SCALES = (
+    (9, "ένα δισεκατομμύριο", "δισεκατομμύρια"),
+    (6, "ένα εκατομμύριο", "εκατομμύρια"),
+)
+
+
+def _convert_large_number(number: str) -> str:
+    """ Convert a number of 7 to 12 digits by splitting it into 3-digit groups. Each group above the
+        thousands is followed by its scale word, e.g. 3000250000 -> "τρία δισεκατομμύρια διακόσιες πενήντα χιλιάδες".
+        Groups that are all zeros are skipped and a group equal to 1 uses the singular form (ένα εκατομμύριο).
+        Args:
+            number: A string of 7 to 12 digits (may contain leading zeros).
+        Returns:
+            The greek words for the number.
+    """
+    words = []
+    for digits, singular, plural in _LARGE_SCALES:
+        if len(number) <= digits:
+            continue
+        group = int(number[:-digits])
+        number = number[-digits:]
+        if group == 1:
+            words.append(singular)
+        elif group:
+            words.append(_WORDS_0_999[group] + " " + plural)
+    # The last 6 digits are handled by the thousands conversion (which also strips the leading zeros)
+    words.append(_convert_6digit(number))
+    return _join_words(*words)
+
+
+# From 1000000 (1 million) to 999 999 999 999 the conversion only depends on the 3 digit groups
+_convert_more_than7_less_than10_digits = _convert_more_than10_less_than13_digits = _convert_large_number
+
+
+# The conversion function to use for each number of digits (index 0 is never used since "" is not a digit)
+_CONVERTERS = (
+    None,
+    _convert_1digit,
+    _convert_2digit,
+    _convert_3digit,
+    _convert_4digit,
+    _convert_5digit,
+    _convert_6digit,
+    _convert_more_than7_less_than10_digits,  # from 1 million to 999999999
+    _convert_more_than7_less_than10_digits,
+    _convert_more_than7_less_than10_digits,
+    _convert_more_than10_less_than13_digits,  # from 1 billion to 999 999 999 999
+    _convert_more_than10_less_than13_digits,
+    _convert_more_than10_less_than13_digits,
+)
+
+
+@lru_cache(maxsize=131072)
 def convert_numbers(word: str) -> str:
     """ Given a string as input, the function will return its transliteration if
         the string can be transformed to a digit. Otherwise, it will return the
@@ -296,78 +205,82 @@ def convert_numbers(word: str) -> str:
             The transliteration of the integer if an integer is provided.
             Otherwise, it will return the same word.
             If the word has spaces on its sides then they will be stripped.
+            Results are memoized since the same tokens (e.g. 1, 100, 2020) repeat a lot in real text.
         Raises:
             ValueError: If the input word is an integer of more than 13 digits.
     """
     word = word.strip()
     if not word.isdigit():
         return word
-    else:
-        if len(word) == 1:
-            return _convert_1digit(word)
-        elif len(word) == 2:
-            return _convert_2digit(word)
-        elif len(word) == 3:
-            return _convert_3digit(word)
-        elif len(word) == 4:
-            return _convert_4digit(word)
-        elif len(word) == 5:
-            return _convert_5digit(word)
-        elif len(word) == 6:
-            return _convert_6digit(word)
-        elif 7 <= len(word) <= 9:  # from 1 million to 999999999
-            return _convert_more_than7_less_than10_digits(word)
-        elif 10 <= len(word) <= 12:  # from 1 billion to 999 999 999 999
-            return _convert_more_than10_less_than13_digits(word)
-        else:
-            raise ValueError("We only accept integers of maximum 13 digits")
+    if len(word) >= len(_CONVERTERS):
+        raise ValueError("We only accept integers of maximum 13 digits")
+    return _CONVERTERS[len(word)](word)
+
+
+# Patterns used by convert_sentence (compiled once)
+_non_word_pattern = re.compile(r"[^\w0-9]+")
+_digit_pattern = re.compile(r"\d")
+_word_digits_pattern = re.compile(r"([a-zα-ωά-ώϊΐϋΰ]+)([0-9]+)", re.I)
+
+
+def _warn_to_lower_deprecated(to_lower):
+    # The converted text has always been lowercased (regardless of to_lower), so the argument is a no-op.
+    if to_lower is not None:
+        warnings.warn("The to_lower argument is deprecated and will be removed: it has no effect since "
+                      "the converted text is always lowercase.", DeprecationWarning, stacklevel=3)
+
+
+def _convert_sentence_word(word: str) -> list:
+    """ Convert a single (already cleaned and lowercased) token of a sentence.
+        Args:
+            word: A token that contains only characters and digits.
+        Returns:
+            A list with the words that the token produced (numbers are converted to words).
+    """
+    if word.isdigit():
+        # Nothing to split, so go straight to the conversion.
+        return [convert_numbers(word)]
+    # Split words into words and digits (numbers). E.g. είναι2 -> είναι 2.
+    match = _word_digits_pattern.match(word)
+    if match is None:
+        # Not a number (and not a word followed by a number), so there is nothing to convert.
+        return [word]
+    letters, digits = match.groups()
+    return [letters, convert_numbers(digits)]
+
+
+def convert_sentence(sentence: str, to_lower: bool = None):
+    """ Convert the numbers of a sentence to words. The output is always lowercase (to_lower is deprecated). """
+    _warn_to_lower_deprecated(to_lower)
+    return _convert_sentence(sentence)
 
 
-def convert_sentence(sentence: str, to_lower: bool = False):
+def _convert_sentence(sentence: str):
     sentence = handle_commas(sentence)
     # sentence = re.sub(r"\.", " . ", sentence)
-    final_sent = []
-    if to_lower:
-        sentence = sentence.lower()
-    sentence = re.sub(r"[^\w0-9]+", " ", sentence)
-    sentence = re.sub(r"\s+", " ", sentence).strip()
-    for word in sentence.split():
-        word = word.lower()
-        # Step 1: Process words (use basic substitutes and get rid of punctuation etc).
-        word = process_word(word, to_lower=to_lower, remove_unknown_chars=True)
-        for sub_word in word.split():
-            if sub_word == "":
-                continue
-            # Step 2: Split words into words and digits (numbers). E.g. είναι2 -> είναι 2.
-            match = re.match(r"([a-zα-ωά-ώϊΐϋΰ]+)([0-9]+)", sub_word, re.I)
-            if match:
-                words = match.groups()
-            else:
-                words = [word]
-            for w in words:
-                if w.strip() == "":
-                    continue
-                # Step 3: Convert numbers to words (if they exist).
-                final_sent.append(convert_numbers(w))
-    # Concatenate punctuation (e.g. from "they had 9 . the others had 10 ." to "they had nine. the others had 10.")
-    #  -> Note that the space before the dots appears deliberately (check process_word in utils.py).
-    final_sent = " ".join(final_sent)
-    final_sent = re.sub(r"\s+", " ", final_sent)
-    final_sent = re.sub(r"\s\.", ".", final_sent)
-    final_sent = re.sub(r"\s\?", "?", final_sent)
-    final_sent = re.sub(r"\s\n", "\n", final_sent)
-    final_sent = re.sub(r"\s\t", "\t", final_sent)
-    for char in punctuation:
-        final_sent = re.sub(" " + char, char, final_sent)
-    final_sent = re.sub(":", " ", final_sent)
-    final_sent = re.sub(r"\s+", " ", final_sent)
+    # Clean the whole sentence once (this is what process_word would do to each token): keep only
+    # characters and digits and lowercase. Since no punctuation survives this, the converted words can be
+    # joined as they are (empty conversions, e.g. of "00", are skipped so that there are no double spaces).
+    sentence = _non_word_pattern.sub(" ", sentence).lower()
+    if _digit_pattern.search(sentence) is None:
+        # There are no numbers at all, so there is nothing to convert
+        return " ".join(sentence.split())
+    final_sent = " ".join(w for word in sentence.split() for w in _convert_sentence_word(word) if w)
     return final_sent
 
 
-def _replace_file_contents(filepath: str, to_lower: bool = False):
+# Kaldi transcripts often repeat whole utterances (e.g. prompts), so the converted lines are memoized as well.
+# Only single transcript lines go through the cache (whole files would be kept in memory as keys and values).
+@lru_cache(maxsize=4096)
+def _convert_transcript(transcript: str):
+    return _convert_sentence(transcript)
+
+
+def _replace_file_contents(filepath: str, to_lower: bool = None):
     """
         Args:
             filepath: The path to the file for which you want to change the numbers to words.
+            to_lower: Deprecated, has no effect (the converted text is always lowercase).
         Returns:
             Nothing
     """
@@ -375,35 +288,51 @@ def _replace_file_contents(filepath: str, to_lower: bool = False):
     if not os.path.exists(filepath):
         raise FileNotFoundError("Could not locate the path that you provided:", filepath)
     # ----------------------------- REPLACE FILE -------------------------------
-    # Create temporary file which will replace the old one.
-    fh, abs_path = mkstemp()
-    with os.fdopen(fh, 'w') as newf:
-        with open(filepath, "r", encoding="utf-8") as f:
-            text = convert_sentence(f.read(), to_lower=to_lower)
-            newf.write(text)
-    # Remove old file
-    os.remove(filepath)
-    # Move new file
-    move(abs_path, filepath)
-
-
-def convert_kaldi_text(kaldi_text_path, out_path=None, is_shell_command=False, to_lower=False):
+    _warn_to_lower_deprecated(to_lower)
+    text = _convert_sentence(Path(filepath).read_text(encoding="utf-8"))
+    # Create temporary file which will replace the old one. It is placed next to the original
+    # so that os.replace can swap them atomically (same filesystem).
+    with NamedTemporaryFile("w", encoding="utf-8", dir=os.path.dirname(os.path.abspath(filepath)),
+                            delete=False) as newf:
+        newf.write(text)
+    # Replace the old file with the new one
+    os.replace(newf.name, filepath)
+
+
+def convert_kaldi_text(kaldi_text_path, out_path=None, is_shell_command=False, to_lower=None, num_workers=1):
+    """ Convert the numbers of a kaldi text file (utt_id word1 word2 ... wordN) to words.
+        Args:
+            kaldi_text_path: The path to the kaldi text file.
+            out_path: Where the new text file will be saved. If None then the input file is replaced.
+            to_lower: Deprecated, has no effect (the converted text is always lowercase).
+            num_workers: The number of processes used to convert the lines. The lines are independent,
+                         so large files can be split across all of the cores (default: 1, no extra processes).
+        Returns:
+            The new lines of the kaldi text file.
+    """
+    _warn_to_lower_deprecated(to_lower)
     assert os.path.isfile(kaldi_text_path), "Path to the kaldi text file does not exist " \
                                             "or is a directory: {}.".format(kaldi_text_path)
-    new_lines = []
+    utt_ids, transcripts = [], []
     with open(kaldi_text_path, "r", encoding="utf-8") as fr:
-        line = fr.readline()
-        while line:
-            utt_id = line.split()[0]
-            line = " ".join(line.split()[1:]).strip().replace("\n", "")  # get rid of the utt_id
-            new_line = convert_sentence(line, to_lower=to_lower)
-            new_line = utt_id + " " + new_line + "\n"
-            new_lines.append(new_line)
-            line = fr.readline()
+        for line in fr:
+            if line.isspace():
+                continue
+            # Split only once in order to get rid of the utt_id
+            utt_id, *transcript = line.split(maxsplit=1)
+            utt_ids.append(utt_id)
+            transcripts.append(transcript[0] if transcript else "")
+    if num_workers > 1:
+        # map keeps the order of the lines
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            sentences = list(executor.map(_convert_transcript, transcripts, chunksize=1024))
+    else:
+        sentences = map(_convert_transcript, transcripts)
+    new_lines = [utt_id + " " + sentence + "\n" for utt_id, sentence in zip(utt_ids, sentences)]
     if out_path is None:
         out_path = kaldi_text_path
     with open(out_path, "w", encoding="utf-8") as fw:
-        fw.writelines(new_lines)
+        fw.write("".join(new_lines))
     return new_lines
 
 
@@ -431,13 +360,16 @@ def main():
     parser.add_argument("--kaldi-text", required=False, default=None,
                         help="Path to a kaldi text file. This means that the format will "
                              "comply with: utt_id word1 word2 ... wordN")
-    parser.add_argument("--to-lower", "-l", required=False, default=True,
-                        choices=['true', 'True', True, 'false', 'False', False],
-                        help="If True then the output file will only contain lowercase "
-                             "characters. Otherwise, the case will be left as is.")
+    parser.add_argument("--to-lower", "-l", required=False, default=None,
+                        choices=['true', 'True', 'false', 'False'],
+                        help="Deprecated, has no effect. The output file always contains only "
+                             "lowercase characters.")
     parser.add_argument("--out-path", required=False, default="./tempout",
                         help="If --kaldi-text is provided then the --out-path will define "
                              "where the new kaldi text file will be placed.")
+    parser.add_argument("--num-workers", "-j", required=False, default=1, type=int,
+                        help="If --kaldi-text is provided then its lines will be converted using this "
+                             "many processes.")
     parser.add_argument("--shell-command", action="store_true", dest="is_shell_command",
                         help="If provided then we will redirect the output to stdout and "
                              "then you can handle that from your bash script.")
@@ -445,17 +377,17 @@ def main():
     parser.add_argument("-t", "--test-word", required=False, default="NONE",
                         help="A test word in order to test the functionality of the script.")
     args = parser.parse_args()
-    if args.to_lower in ['true', 'True', True]:
-        to_lower = True
-    else:
-        to_lower = False
+    if args.to_lower is not None:
+        warnings.warn("--to-lower is deprecated and will be removed: it has no effect since "
+                      "the converted text is always lowercase.", DeprecationWarning)
     if args.test_word != "NONE":
         print(convert_sentence(args.test_word))
         print("Converted test word, now exiting...")
         sys.exit(1)
     if args.kaldi_text is not None:
         out = convert_kaldi_text(args.kaldi_text, out_path=args.out_path,
-                                 is_shell_command=args.is_shell_command, to_lower=to_lower)
+                                 is_shell_command=args.is_shell_command,
+                                 num_workers=args.num_workers)
         if args.is_shell_command is True:
             print("".join(out))
         else:
@@ -470,17 +402,18 @@ def main():
         # ------------------------ CASE 1: INPUT IS FILE ---------------------------
         if os.path.isfile(filepath):
             # Create temporary file which will replace the old one.
-            _replace_file_contents(filepath, to_lower=to_lower)
+            _replace_file_contents(filepath)
             print("Success!")
             print("Done processing file from the file:", filepath)
             sys.exit(1)
         # ------------------------ CASE 2: INPUT IS DIR ---------------------------
         if os.path.isdir(filepath):
-            text_file_dir = glob.glob(os.path.join(filepath, "*" + args.extension))
-            if len(text_file_dir) == 0:
+            text_files = glob.iglob(os.path.join(filepath, "*" + args.extension))
+            first_file = next(text_files, None)
+            if first_file is None:
                 raise ValueError("The directory that you provided is empty")
-            for text_file in text_file_dir:
-                _replace_file_contents(text_file, to_lower=to_lower)
+            for text_file in chain([first_file], text_files):
+                _replace_file_contents(text_file)
             print("Success!")
             print("Done processing files from the directory:", filepath)
             sys.exit(1)
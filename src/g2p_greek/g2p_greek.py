@@ -57,6 +57,9 @@ import sys
 import warnings
 
 import re
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache
 from string import punctuation as valid_punctuation
 
 from g2p_greek.rules import *
@@ -68,7 +71,7 @@ except ImportError:
     convert_ordinals = lambda x: x
     from g2p_greek.digits_to_words import convert_numbers
 
-from g2p_greek.dictionary import Dictionary
+from g2p_greek.dictionary import Dictionary, default_lexicon_cache_dir
 from g2p_greek.phoneme_conversion import convert_word
 
 try:
@@ -76,7 +79,28 @@ try:
 except ImportError:
     english_mappings = {}
 
+# realpath: if the module is symlinked (e.g. into site-packages) the data files are looked up next to the real file
 script_dir = os.path.dirname(os.path.realpath(__file__))
+# Default paths of the command line arguments (resolved once)
+_default_out_path = os.path.join(script_dir, "..", "tests", "output.dic")
+_default_substitute_words_path = os.path.join(script_dir, "..", "data", "substitute_words.json")
+_default_lexicon_path = os.path.join(script_dir, "..", "..", "data", "el-gr.dic")
+_default_unknown_words_path = os.path.join(script_dir, "..", "..", "data", "somewords.txt")
+
+_space_tab_pattern = re.compile(r"\s\t")
+# A list of hyphens taken from here: http://jkorpela.fi/dashes.html (all of them are replaced by spaces)
+_hyphens_table = str.maketrans(dict.fromkeys("-~֊᠆‐‑‒–—―⁓⁻₋−〜﹘﹣－", " "))
+_tokens_pattern = re.compile(r"\d+|[^\s\d]+")
+_whitespace_pattern = re.compile(r"\s+")
+_write_buffer_size = 1 << 20  # 1MB
+# Single letters are replaced with str.translate, while multi-letter mappings (e.g. "th") are replaced
+# beforehand with a single regex (longest first, so that they take precedence over their letters)
+_latin_chars_table = str.maketrans({letter: greek for letter, greek in english_mappings.items() if len(letter) == 1})
+_latin_groups = {letters: greek for letters, greek in english_mappings.items() if len(letters) > 1}
+_latin_groups_pattern = re.compile("|".join(map(re.escape, sorted(_latin_groups, key=len, reverse=True)))) \
+    if _latin_groups else None
+# Every character that may be replaced; words without any of them (most of them) are left untouched
+_latin_chars = frozenset("".join(english_mappings))
 
 
 def basic_preprocessing(initial_word: str, to_lower: bool = True, punctuation_to_keep: list = [],
@@ -94,31 +118,44 @@ def basic_preprocessing(initial_word: str, to_lower: bool = True, punctuation_to
             For example, if the input is "10,9" then is will be converted to
             "10 κόμμα 9" (decimal handling).
     """
-    initial_word = re.sub(r"\s\t", "\t", initial_word)
+    initial_word = _space_tab_pattern.sub("\t", initial_word)
     if to_lower: initial_word = initial_word.lower()
     word_complex = handle_commas(initial_word).strip()
     word_complex = handle_hours(word_complex)
-    # A list of hyphens taken from here: http://jkorpela.fi/dashes.html
-    word_complex = re.sub(r"-|-|-|~|֊|᠆|‐|‑|‒|–|—|―|⁓|⁻|₋|−|〜|﹘|﹣|－", " ", word_complex)
+    word_complex = word_complex.translate(_hyphens_table)
     # Convert ordinals (if the num2word package is installed)
     word_complex = convert_ordinals(word_complex)
     # print(word_complex)
-    new_word = ""
+    parts: list = []
     for word in word_complex.split():
         # ----- BASIC PROCESSING -----
         word = process_word(word, to_lower=False, keep_only_chars_and_digits=True, 
                             basic_substitutes=substitute_words_dict, punctuation_to_keep=punctuation_to_keep)
-        for sub_word in word.split():
-            if sub_word.strip() == "":
-                continue
-            # Split words into words and digits (numbers). E.g. είναι2 -> είναι 2
-            words = re.split(r"(\d+)", sub_word)  # may have spaces
-            words = [w for w in words if w.strip() != ""]  # remove spaces from list
-            for w in words:
-                new_word += w + " "
-        new_word += " "
-    new_word = re.sub(r"\s+", " ", new_word).strip()
-    return new_word
+        # Split words into words and digits (numbers). E.g. είναι2 -> είναι 2
+        # A single scan yields the non-empty tokens, so no whitespace cleanup is needed afterwards.
+        parts.extend(_tokens_pattern.findall(word))
+    return " ".join(parts)
+
+
+@lru_cache(maxsize=1)
+def _load_dictionary(lexicon_path: str, N: int, mtime: float, cache_dir: str = None) -> Dictionary:
+    # Loading the lexicon is expensive, so the Dictionary is shared between the G2P objects of the same
+    # process. The modification time is part of the key so that a changed lexicon file is loaded again.
+    # Only the last one is kept, since each lexicon dict takes hundreds of MB (a changed or another
+    # lexicon evicts the previous one).
+    return Dictionary(lexicon_path, N, cache_dir=cache_dir)
+
+
+def clear_lexicon_cache():
+    """ Releases the lexicon that is shared between the G2P objects of this process (it is loaded again
+        the next time it is needed). G2P objects that have already been initialized keep their own reference.
+    """
+    _load_dictionary.cache_clear()
+
+
+def _format_line(word: str, phonemes: str) -> str:
+    # An output line: the word followed by its (space separated) phonemes, if there are any
+    return word + " " + phonemes + "\n" if phonemes else word + "\n"
 
 
 def _number_to_word(number: str) -> str:
@@ -132,9 +169,35 @@ def _number_to_word(number: str) -> str:
     return convert_numbers(number)
 
 
+def _unique_words(lines):
+    """ Yields the (line index, word) pairs of the non empty lines, skipping words that have already
+        been seen (they would produce the same output lines, which are deduplicated anyway).
+    """
+    seen_words = set()
+    for i, line in enumerate(lines):
+        word = line.strip()
+        if word and word not in seen_words:
+            seen_words.add(word)
+            yield i, word
+
+
+# The G2P object of each worker process (see G2P._iter_converted_lines)
+_worker_g2p = None
+
+
+def _init_worker(g2p):
+    global _worker_g2p
+    _worker_g2p = g2p
+
+
+def _convert_line_in_worker(numbered_line):
+    return _worker_g2p._convert_line(*numbered_line)
+
+
 class G2P(object):
     def __init__(self, words_txt_path: str = None, out_path: str = None, is_shell_command: bool = False, use_numbers: bool = False,
-                 lexicon_path: str = None, substitute_words_path: str = None, N: int = 3, test_mode: bool = False, punc_to_keep=""):
+                 lexicon_path: str = None, substitute_words_path: str = None, N: int = 3, test_mode: bool = False, punc_to_keep="",
+                 num_workers: int = 1, lexicon_cache_dir: str = None):
         """ Finds the phonemes of a list of unknown words from a file in this format:
                 word1
                 word2
@@ -161,6 +224,12 @@ class G2P(object):
                                        transliteration (e.g. {"mercedes": "μερσέντες", "ok": "οκέι", ...}).
                                        If None then we won't substitute any word.
                 test_mode: True if we are in test mode (check --test-word or -t in the arguments).
+                num_workers: The number of processes used to convert the words. The words are independent
+                             so with num_workers > 1 they are converted in parallel (the output order
+                             is preserved).
+                lexicon_cache_dir: If given, the parsed lexicon is cached in this directory so that the
+                                   next runs load it faster (e.g. default_lexicon_cache_dir() from
+                                   dictionary.py). If None then the lexicon is parsed every time.
             Returns:
                 The output lines of the new lexicon.
         """
@@ -175,136 +244,158 @@ class G2P(object):
         self.lexicon_path = lexicon_path
         self.lexicon = None  # will be initialize when convert_from_lexicon is called
         self.substitute_words_dict = read_substitute_words(substitute_words_path)
+        # The substitutions are case insensitive (check process_word in utils.py)
+        self._substitute_keys = frozenset(key.lower() for key in self.substitute_words_dict)
         self.is_shell_command = is_shell_command
         self.use_numbers = use_numbers
         self.N = N
         self.punc_to_keep = punc_to_keep
+        self.num_workers = num_workers
+        self.lexicon_cache_dir = lexicon_cache_dir
 
     def initialize_lexicon(self):
-        self.lexicon =  Dictionary(self.lexicon_path, self.N)
+        self.lexicon = _load_dictionary(self.lexicon_path, self.N, os.path.getmtime(self.lexicon_path),
+                                        self.lexicon_cache_dir)
 
     @staticmethod
     def convert_latin_chars(sentence):
-        edited_sentence = sentence
-        if english_mappings != {}:
-            for letter in set(sentence):
-                if letter in english_mappings.keys():
-                    edited_sentence = re.sub(letter, english_mappings[letter], edited_sentence)
-        return edited_sentence
-
-    def _convert_from_list(self, lines):
+        if _latin_chars.isdisjoint(sentence):
+            return sentence
+        if _latin_groups_pattern is not None:
+            sentence = _latin_groups_pattern.sub(lambda match: _latin_groups[match.group()], sentence)
+        return sentence.translate(_latin_chars_table)
+
+    def _iter_converted_lines(self, lines):
+        """ Yields the output lines (word followed by its phonemes) of the given input lines as soon as
+            they are produced. Duplicate output lines are only yielded once.
+        """
+        seen_lines: set = set()
+        numbered_words = _unique_words(lines)
+        if self.num_workers > 1:
+            executor = ProcessPoolExecutor(max_workers=self.num_workers, initializer=_init_worker, initargs=(self,))
+            converted_lines = executor.map(_convert_line_in_worker, numbered_words, chunksize=1024)
+        else:
+            executor = nullcontext()
+            convert_line = self._convert_line
+            converted_lines = (convert_line(i, initial_word) for i, initial_word in numbered_words)
+        with executor:
+            for out_lines in converted_lines:
+                for out in out_lines:
+                    if out not in seen_lines:  # remove duplicates
+                        seen_lines.add(out)
+                        yield out
+
+    def _convert_line(self, i, initial_word):
+        """ Converts a single line (i is its index, used for error messages) of the words file and returns
+            the corresponding output lines.
+        """
         out_lines: list = []
-        for i, initial_word in enumerate(lines):
-            if initial_word.replace("\n", "").strip() == "":
-                continue
-            initial_word_complex = initial_word.strip()
-            # Step 1: Make sure there are not spaces
-            if " " in initial_word_complex:
-                raise ValueError("Found space inside an entry of words.txt.\nLine: {}\nWord: {}.".format(i, initial_word_complex))
-            # Step 2: Pre-processing and digit handling
+        # Local bindings for the attributes used in the loop below
+        lexicon = self.lexicon
+        get_word_phonemes = lexicon.get_word_phonemes if lexicon is not None else None
+        if initial_word.replace("\n", "").strip() == "":
+            return out_lines
+        initial_word_complex = initial_word.strip()
+        # Step 1: Make sure there are not spaces
+        if " " in initial_word_complex:
+            raise ValueError("Found space inside an entry of words.txt.\nLine: {}\nWord: {}.".format(i, initial_word_complex))
+        # Step 2: Pre-processing and digit handling. Most words only contain letters and are not substituted,
+        #         in which case the preprocessing would only convert them to lowercase.
+        lowercase_word = initial_word_complex.lower()
+        if lowercase_word.isalpha() and lowercase_word not in self._substitute_keys:
+            initial_word_complex = lowercase_word
+        else:
             initial_word_complex = basic_preprocessing(initial_word_complex, substitute_words_dict=self.substitute_words_dict, punctuation_to_keep=self.punc_to_keep)
-            # Step 3: Get rid of latin characters (if any). TODO: add more complex rules for english.
-            edited_word_complex = self.convert_latin_chars(initial_word_complex)
-            # The processing may have created more than one words (e.g. 102.4 -> εκατό δύο κόμμα τέσσερα)
-            for initial_sub_word, edited_sub_word in zip(initial_word_complex.split(), edited_word_complex.split()):
-                edited_sub_word = edited_sub_word.lower().strip()
-                # Convert numbers to words
-                if edited_sub_word.isdigit():
-                    edited_sub_word = _number_to_word(edited_sub_word)
-                    if not self.use_numbers:  # Then we are going to completely ignore numbers
-                        out = ""
-                        for edited_w in edited_sub_word.split():
-                            if self.lexicon is None:  # there are very few iterations, so we can put this if inside the for loop
-                                _, current_phones = convert_word(edited_w)  # Get word and phonemes
-                                # Use only the transliteration
-                                out += edited_w + " " + " ".join(current_phones) + "\n"  # append new line at the end
-                            else:
-                                # Use only the transliteration
-                                out += self.lexicon.get_word_phonemes(word=edited_w, initial_word=None) + " "
-                        out = re.sub(r"\s+", " ", out).strip()
-                    else:                            
-                        # If the number can be expressed in just one word then keep it.
-                        # E.g. 1936 -> "χιλια εννιακοσια τριανταεξι" : more than 1 word so we won't keep the number
-                        #      But 10 -> "δεκα" : only one word so we will keep the number 10
-                        if len(edited_sub_word.split()) > 1:
-                            out = ""
-                            for edited_w in edited_sub_word.split():
-                                # Use only the transliteration
-                                if self.lexicon is None:
-                                    _, current_phones = convert_word(edited_w)  # Get word and phonemes
-                                    out += edited_w + " " + " ".join(current_phones) + "\n"  # append new line at the end
-                                else:
-                                    out += self.lexicon.get_word_phonemes(word=edited_w, initial_word=None) + " "
-                            out = re.sub(r"\s+", " ", out).strip()
-                        elif len(edited_sub_word.split()) == 1:
-                            if self.lexicon is None:
-                                # We expect the phonemes to correspond to only one word.
-                                _, current_phones = convert_word(edited_sub_word)  # Get word and phonemes
-                                out = edited_sub_word + " " + " ".join(current_phones) + "\n"  # append new line at the end
-                            else:
-                                # We expect the phonemes to correspond to only one word.
-                                out = self.lexicon.get_word_phonemes(word=edited_sub_word, initial_word=initial_sub_word)
-                        else:
-                            # If we get here then there is probably some bug
-                            warnings.warn("Error occurred while converting a digit: {}.".format(initial_sub_word))
-                            continue
-                else:
-                    if len(edited_sub_word) == 1:  # single character
-                        if edited_sub_word in single_letter_words:
-                            pass
-                        elif edited_sub_word in single_letter_pronounciations.keys():
-                            # E.g. convert "α" to "άλφα"
-                            edited_sub_word = single_letter_pronounciations[edited_sub_word]
-                        elif edited_sub_word in self.punc_to_keep:
-                            continue
+        # Step 3: Get rid of latin characters (if any). TODO: add more complex rules for english.
+        edited_word_complex = self.convert_latin_chars(initial_word_complex)
+        # The processing may have created more than one words (e.g. 102.4 -> εκατό δύο κόμμα τέσσερα)
+        initial_sub_words = initial_word_complex.split()
+        # Only split again if latin characters were replaced (the replacements never contain spaces)
+        edited_sub_words = initial_sub_words if edited_word_complex == initial_word_complex else edited_word_complex.split()
+        for initial_sub_word, edited_sub_word in zip(initial_sub_words, edited_sub_words):
+            edited_sub_word = edited_sub_word.lower().strip()
+            # Convert numbers to words
+            if edited_sub_word.isdigit():
+                edited_sub_word = _number_to_word(edited_sub_word)
+                if not self.use_numbers:  # Then we are going to completely ignore numbers
+                    out = self._convert_number_words(edited_sub_word) + "\n"
+                else:                            
+                    # If the number can be expressed in just one word then keep it.
+                    # E.g. 1936 -> "χιλια εννιακοσια τριανταεξι" : more than 1 word so we won't keep the number
+                    #      But 10 -> "δεκα" : only one word so we will keep the number 10
+                    if len(edited_sub_word.split()) > 1:
+                        out = self._convert_number_words(edited_sub_word) + "\n"
+                    elif len(edited_sub_word.split()) == 1:
+                        if lexicon is None:
+                            # We expect the phonemes to correspond to only one word.
+                            _, current_phones = convert_word(edited_sub_word)  # Get word and phonemes
+                            out = _format_line(edited_sub_word, " ".join(current_phones))
                         else:
-                            warnings.warn("An unseen character has been observed while "
-                                          "creating the lexicon: {}.".format(edited_sub_word))
-                            continue
-                    if self.lexicon is None:
-                        _, current_phones = convert_word(edited_sub_word)  # Get word and phonemes
-                        out = initial_sub_word + " " + " ".join(current_phones) + "\n"  # append new line at the end
+                            # We expect the phonemes to correspond to only one word.
+                            out = get_word_phonemes(word=edited_sub_word, initial_word=initial_sub_word)
                     else:
-                        out = self.lexicon.get_word_phonemes(edited_sub_word, initial_word=initial_sub_word)
-                out = out.strip()
-                if not out.endswith("\n"): out += "\n"
-                out_lines.append(out)
-        return list(set(out_lines))  # remove duplicates
-
-    def convert_from_lexicon(self):
-        # Lexicon dictionary will be of the form:
-        #   { "αυτ": {"αυτός": "a0 f t o1 s", "αυτοί": "a0 f t i1", ...}, ... }
-        # This is done because the dictionary is huge and it's easier to handle it using a hash map.
-        self.initialize_lexicon()
-        # Get words to transcribe
-        with open(self.words_path, "r", encoding="utf-8") as fr:
-            lines = fr.readlines()
-            out_lines = self._convert_from_list(lines)
-        if not self.is_shell_command:
-            if self.out_path is None:
-                print(out_lines)
+                        # If we get here then there is probably some bug
+                        warnings.warn("Error occurred while converting a digit: {}.".format(initial_sub_word))
+                        continue
             else:
-                # Write the new lines
-                with open(os.path.abspath(self.out_path), "w", encoding="utf-8") as fw:
-                    for line in out_lines:
-                        fw.write(line)
+                if len(edited_sub_word) == 1:  # single character
+                    if edited_sub_word in single_letter_words:
+                        pass
+                    elif edited_sub_word in single_letter_pronounciations:
+                        # E.g. convert "α" to "άλφα"
+                        edited_sub_word = single_letter_pronounciations[edited_sub_word]
+                    elif edited_sub_word in self.punc_to_keep:
+                        continue
+                    else:
+                        warnings.warn("An unseen character has been observed while "
+                                      "creating the lexicon: {}.".format(edited_sub_word))
+                        continue
+                if lexicon is None:
+                    _, current_phones = convert_word(edited_sub_word)  # Get word and phonemes
+                    out = _format_line(initial_sub_word, " ".join(current_phones))
+                else:
+                    out = get_word_phonemes(edited_sub_word, initial_word=initial_sub_word)
+            out_lines.append(out)
         return out_lines
 
-    def convert_file(self):
-        # Read input file
+    def _convert_number_words(self, number_words):
+        # Use only the transliteration of the number (e.g. "δέκα πέντε") and put all of its words
+        # (each followed by its phonemes) in a single line
+        if self.lexicon is None:
+            parts = [w + " " + " ".join(convert_word(w)[1]) for w in number_words.split()]
+        else:
+            parts = [self.lexicon.get_word_phonemes(word=w, initial_word=None) for w in number_words.split()]
+        return _whitespace_pattern.sub(" ", " ".join(parts)).strip()
+
+    def _convert_from_list(self, lines):
+        return list(self._iter_converted_lines(lines))
+
+    def _convert_words_file(self):
+        # Stream the words file through the conversion and write each output line as soon as it is ready
         with open(self.words_path, "r", encoding="utf-8") as fr:
-            lines = fr.readlines()
-            out_lines = self._convert_from_list(lines)
-        if not self.is_shell_command:
-            if self.out_path is None:
-                print(out_lines)
+            if self.is_shell_command or self.out_path is None:
+                out_lines = self._convert_from_list(fr)
             else:
-                # Write the new lines
-                with open(os.path.abspath(self.out_path), "w", encoding="utf-8") as fw:
-                    for line in out_lines:
+                out_lines = []
+                # The lines are written one by one, so use a large buffer to keep the number of write calls low
+                with open(os.path.abspath(self.out_path), "w", encoding="utf-8", buffering=_write_buffer_size) as fw:
+                    for line in self._iter_converted_lines(fr):
                         fw.write(line)
+                        out_lines.append(line)
+        if not self.is_shell_command and self.out_path is None:
+            print(out_lines)
         return out_lines
 
+    def convert_from_lexicon(self):
+        # Lexicon dictionary will be of the form:
+        #   {"αυτός": "a0 f t o1 s", "αυτοί": "a0 f t i1", ...}
+        self.initialize_lexicon()
+        # Get words to transcribe
+        return self._convert_words_file()
+
+    def convert_file(self):
+        return self._convert_words_file()
+
     def convert_test_word(self, initial_word):
         line_list = initial_word.split("\\n")  # convert to line (can also accept multiple lines separated by \n)
         out_lines = self._convert_from_list(line_list)
@@ -330,35 +421,37 @@ def cmdline():
         The latter is NOT recommended and you should do this only if you don't want to use the lexicon since it can
         be time consuming because we are loading the whole lexicon into the memory.
     """
-    general_parser = argparse.ArgumentParser(
-        description="For testing purposes you may use the --test-word argument followed by a single of words.",
-        add_help=False
+    parser = argparse.ArgumentParser(
+        description="For testing purposes you may use the --test-word argument followed by a single of words."
     )
-    general_parser.add_argument("-o", "--out-path", required=False, default=os.path.join(script_dir, "..", "tests", "output.dic"),
-                                # action=InvalidPathError,
-                                help="Output path for the new lexicon (containing words and phonemes).")
-    general_parser.add_argument("-t", "--test-word", required=False, default="",
-                                help="A word (or sequence of words to be used for testing).")
-    general_parser.add_argument("-sh", '--shell-command', action='store_true', dest='is_shell_command',
-                                help='If true then we assume that you are calling this script from a shell command '
-                                     '(i.e. a bash script). In this case, the output will be returned and printed '
-                                     'in the console so that you can redirect it to where you wish. If this is provided'
-                                     ' the out-path argument does not matter since the output file will be defined in '
-                                     'the bash script')
-    general_parser.add_argument("--use-numbers", default=False, choices=['True', 'true', True,
-                                                                         'False', 'false', False],
-                                help="If true then we will use numbers instead of 1-word numbers. This means "
-                                     "that the number 10 will be written as '10 dh e1 k a0' instead of "
-                                     "'δεκα dh e1 k a0' because 10 consists of only 1 word. But the number 1936 "
-                                     "will be converted to the 3 words 'χιλια εννιακοσια τριανταεξι' since the "
-                                     "word consists of more than 1 word.")
-    general_parser.add_argument("--substitute-words-path", "-s", action=InvalidPathError, default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "substitute_words.json"), 
-                                help="Path to a json or CSV file containing matchings from words to their transliteration in Greek."
-                                     "For example, {'mercedes': 'μερσέντες', 'ok': 'οκέι', ...}")
-    general_parser.add_argument("--punctuation-to-keep", type=str, default="", dest="punc_to_keep",
-                                help="A sequence of punctuations you want to keep (without spaces)")
-    general_parser.set_defaults(is_shell_command=False)
-    full_words_parser = argparse.ArgumentParser(
+    parser.add_argument("-o", "--out-path", required=False, default=_default_out_path,
+                        # action=InvalidPathError,
+                        help="Output path for the new lexicon (containing words and phonemes).")
+    parser.add_argument("-t", "--test-word", required=False, default="",
+                        help="A word (or sequence of words to be used for testing).")
+    parser.add_argument("-sh", '--shell-command', action='store_true', dest='is_shell_command',
+                        help='If true then we assume that you are calling this script from a shell command '
+                             '(i.e. a bash script). In this case, the output will be returned and printed '
+                             'in the console so that you can redirect it to where you wish. If this is provided'
+                             ' the out-path argument does not matter since the output file will be defined in '
+                             'the bash script')
+    parser.add_argument("--use-numbers", default=False, choices=['True', 'true', True,
+                                                                 'False', 'false', False],
+                        help="If true then we will use numbers instead of 1-word numbers. This means "
+                             "that the number 10 will be written as '10 dh e1 k a0' instead of "
+                             "'δεκα dh e1 k a0' because 10 consists of only 1 word. But the number 1936 "
+                             "will be converted to the 3 words 'χιλια εννιακοσια τριανταεξι' since the "
+                             "word consists of more than 1 word.")
+    parser.add_argument("--substitute-words-path", "-s", action=InvalidPathError, default=_default_substitute_words_path,
+                        help="Path to a json or CSV file containing matchings from words to their transliteration in Greek."
+                             "For example, {'mercedes': 'μερσέντες', 'ok': 'οκέι', ...}")
+    parser.add_argument("--punctuation-to-keep", type=str, default="", dest="punc_to_keep",
+                        help="A sequence of punctuations you want to keep (without spaces)")
+    parser.add_argument("--num-workers", "-j", type=int, default=1,
+                        help="Number of processes used to convert the words (default: 1).")
+    parser.set_defaults(is_shell_command=False)
+    full_words_group = parser.add_argument_group(
+        "full words",
         description="Provide a words.txt file in kaldi format, meaning just a text file containing different "
                     "words in each line. The output will be a new lexicon file containing all of the words "
                     "followed by their phonemes. For each word, if it exists in the original cmu_sphinx lexicon then "
@@ -366,79 +459,76 @@ def cmdline():
                     "script."
                     "\nE.g. g2p_greek --path-to-words-txt /home/user/words.txt"
                     "                 --path-to-lexicon /home/user/cmu_sphinx/el-gr.dic"
-                    "                 --out-path /home/user/new_lexicon.dic",
-        add_help=False
+                    "                 --out-path /home/user/new_lexicon.dic"
     )
-    full_words_parser.add_argument("-w", "--path-to-words-txt", required=False, default=None, action=InvalidPathError,
-                                   help="Path to the words.txt file (or any other name) that contains all of the words"
-                                        "that appear in our data (e.g. in the kaldi text file).")
-    full_words_parser.add_argument("-l", "--path-to-lexicon", required=False, default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "data", "el-gr.dic"),
-                                   action=InvalidPathError,
-                                   help="Path to the lexicon containing the already known phonemes of all words "
-                                        "that appear in the words.txt file above.")
-    unknown_words_parser = argparse.ArgumentParser(
+    full_words_group.add_argument("-w", "--path-to-words-txt", required=False, default=None, action=InvalidPathError,
+                                  help="Path to the words.txt file (or any other name) that contains all of the words"
+                                       "that appear in our data (e.g. in the kaldi text file).")
+    full_words_group.add_argument("-l", "--path-to-lexicon", required=False, default=_default_lexicon_path,
+                                  action=InvalidPathError,
+                                  help="Path to the lexicon containing the already known phonemes of all words "
+                                       "that appear in the words.txt file above.")
+    full_words_group.add_argument("--cache-lexicon", action="store_true", dest="cache_lexicon",
+                                  help="Cache the parsed lexicon in the user cache directory ({}) so that the "
+                                       "next runs load it faster.".format(default_lexicon_cache_dir()))
+    unknown_words_group = parser.add_argument_group(
+        "unknown words",
         description="Provide a text file with unknown words (words not in lexicon) separated by new lines. There should"
                     "be as many lines as the number of words for which you want to produce the phonemes."
                     "The output will be a text file containing the words followed by their phonemes. See example below."
                     "\nE.g. g2p_greek --path-to-unknown-words /home/user/unknown_words.txt "
-                    "                 --out-path /home/user/new_lexicon.dic",
-        add_help=False
+                    "                 --out-path /home/user/new_lexicon.dic"
     )
-    unknown_words_parser.add_argument("-u", "--path-to-unknown-words", required=False, default=os.path.join(script_dir, "..", "..", "data", "somewords.txt"),
-                                      action=InvalidPathError,
-                                      help="Path to a text file containing words in each line.")
-    # a super parser for sanity checks
-    super_parser = argparse.ArgumentParser(
-        parents=[general_parser, full_words_parser, unknown_words_parser])
-    super_parser.parse_args()
-    # Parse individual arguments
-    general_args, _ = general_parser.parse_known_args()
-    full_words_args, _ = full_words_parser.parse_known_args()
-    unknown_words_args, _ = unknown_words_parser.parse_known_args()
-
-    if general_args.use_numbers in [True, 'true', 'True']:
+    unknown_words_group.add_argument("-u", "--path-to-unknown-words", required=False, default=_default_unknown_words_path,
+                                     action=InvalidPathError,
+                                     help="Path to a text file containing words in each line.")
+    args = parser.parse_args()
+
+    if args.use_numbers in [True, 'true', 'True']:
         use_numbers = True
     else:
         use_numbers = False
     # ----------------------- CONVERT TEST WORD -----------------------------
     # If there is a test word then calculate its phonemes and exit
-    if general_args.test_word != "":
-        word = general_args.test_word
-        g2p = G2P(test_mode=True, substitute_words_path=general_args.substitute_words_path, 
-                  use_numbers=use_numbers, punc_to_keep=general_args.punc_to_keep)
+    if args.test_word != "":
+        word = args.test_word
+        g2p = G2P(test_mode=True, substitute_words_path=args.substitute_words_path, 
+                  use_numbers=use_numbers, punc_to_keep=args.punc_to_keep)
         out = g2p.convert_test_word(word)
         print(out)
         sys.exit(0)
 
     # --------------------- NON TEST MODES ------------------------
-    if full_words_args.path_to_words_txt is not None:
-        words_txt_path = full_words_args.path_to_words_txt
-    elif unknown_words_args.path_to_unknown_words is not None:
-        words_txt_path = unknown_words_args.path_to_unknown_words
+    if args.path_to_words_txt is not None:
+        words_txt_path = args.path_to_words_txt
+    elif args.path_to_unknown_words is not None:
+        words_txt_path = args.path_to_unknown_words
     else:
         raise ValueError("Could not initialize the path to the words.txt file. Something must be wrong with the arguments.")
-    g2p = G2P(words_txt_path, general_args.out_path, is_shell_command=general_args.is_shell_command, 
-              use_numbers=use_numbers, lexicon_path=full_words_args.path_to_lexicon, 
-              substitute_words_path=general_args.substitute_words_path, N=3, punc_to_keep=general_args.punc_to_keep)
+    g2p = G2P(words_txt_path, args.out_path, is_shell_command=args.is_shell_command, 
+              use_numbers=use_numbers, lexicon_path=args.path_to_lexicon, 
+              substitute_words_path=args.substitute_words_path, N=3, punc_to_keep=args.punc_to_keep,
+              num_workers=args.num_workers,
+              lexicon_cache_dir=default_lexicon_cache_dir() if args.cache_lexicon else None)
 
     # --------------------------- USE LEXICON (RECOMMENDED) -----------------------------------
     # mode 1: Using the cmu lexicon
-    if (full_words_args.path_to_words_txt is not None) and (os.path.isfile(full_words_args.path_to_lexicon)):
+    if (args.path_to_words_txt is not None) and (os.path.isfile(args.path_to_lexicon)):
         out = g2p.convert_from_lexicon()
-        if general_args.is_shell_command:
+        if args.is_shell_command:
             print("".join(out))
-        elif os.path.isfile(general_args.out_path):
-            print("Success! File saved in: {}".format(general_args.out_path))
+        elif os.path.isfile(args.out_path):
+            print("Success! File saved in: {}".format(args.out_path))
         sys.exit(0)
 
     # ---------------------------------- USE OUR ALGORITHM ---------------------------------
     # mode 2: Do not use the lexicon
-    if unknown_words_args.path_to_unknown_words != ".":
+    if args.path_to_unknown_words != ".":
         out = g2p.convert_file()
-        if general_args.is_shell_command:
+        if args.is_shell_command:
             print("".join(out))
-        elif os.path.isfile(general_args.out_path):
-            print("Success! File saved in: {}".format(general_args.out_path))
+        elif os.path.isfile(args.out_path):
+            print("Success! File saved in: {}".format(args.out_path))
         sys.exit(0)
 
 
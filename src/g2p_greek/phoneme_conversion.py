@@ -1,3 +1,7 @@
+# NOTE: Do not try to speed this module up with numba. The conversion works on short lists of phoneme
+#       strings (rarely more than 20 per word) and its results are memoized in convert_word, so
+#       interning phonemes to integer arrays would cost more than the loops it is meant to speed up.
+
 import argparse
 
 import os
@@ -18,13 +22,25 @@ except ImportError:
     english_mappings = {}
     pass
 
+from functools import lru_cache
 from typing import Tuple
 
 
 non_characters: list = ["", " ", "(", ")", ".", ",", ";", "?", "\n", "\r", "\t"]
 
+# Words without any diphthong map each character to its own phonemes, so we can convert them with a
+# single str.translate call (the values are space separated so that e.g. ψ becomes the two phonemes p s).
+_single_chars_table = str.maketrans({char: phoneme + " " for char, phoneme in character_rules.items()})
+_known_characters = frozenset(character_rules)
+_diphthong_pattern = re.compile("|".join(map(re.escape, diphthong_rules)))
+_vowel_phonemes = frozenset(vowel_phonemes)
+# Some rules map to more than one phoneme (e.g. ψ -> p s), so we keep their values already split into phonemes
+_character_phonemes = {char: phoneme.split() for char, phoneme in character_rules.items()}
+_diphthong_phonemes = {diphthong: phoneme.split() for diphthong, phoneme in diphthong_rules.items()}
+
 
-def convert_word(word: str) -> Tuple[str, list]:
+@lru_cache(maxsize=200000)
+def convert_word(word: str) -> Tuple[str, tuple]:
     """ Gets a word and returns the word followed by its phonemes.
         E.g. convert_word("παράδειγμα") will produce "παράδειγμα p a0 r a1 dh i0 gh m a0"
 
@@ -38,7 +54,8 @@ def convert_word(word: str) -> Tuple[str, list]:
             word: A string containing one word (if there are spaces then you should handle them beforehand)
         Returns:
             word: Either the same word as the input or the transliteration of a digit (by using convert_numbers).
-            current_phones: The phones that correspond to the input word.
+            current_phones: The phones that correspond to the input word (as a tuple, since the results are
+                            memoized and shared between calls; use convert_word.cache_clear() to free them).
     """
     # print("Initial word:", word)
     word = word.strip()
@@ -49,15 +66,15 @@ def convert_word(word: str) -> Tuple[str, list]:
             out = ""
             for w in transliterated_word.split():
                 out += " ".join(convert_word(w)[1]) + " "
-            return transliterated_word, out.strip().split()
+            return transliterated_word, tuple(out.split())
         else:
             word = transliterated_word
     if len(word) == 1:
         try:
-            return word, [character_rules[word]]
+            return word, (character_rules[word],)
         except KeyError:
             warnings.warn("Character {} could not be converted.".format(word), RuntimeWarning)
-            return word, []
+            return word, ()
 
     # word, current_phonemes = _check_single_chars(word)
     # # Since ψ and ξ match to two phonemes we will replace them explicitly
@@ -67,11 +84,13 @@ def convert_word(word: str) -> Tuple[str, list]:
     # # We need to make those separate entries for the phonemes list
     # current_phonemes = " ".join(current_phonemes).split(" ")
     # new_word, current_phonemes = _check_diphthongs(new_word, current_phonemes)
-    word, current_phonemes = _check_till_dipthongs(word)
-    current_phonemes = " ".join(current_phonemes).split(" ")  # For the same reason as two lines above
+    if word and _known_characters.issuperset(word) and _diphthong_pattern.search(word) is None:
+        current_phonemes = word.translate(_single_chars_table).split()
+    else:
+        word, current_phonemes = _check_till_dipthongs(word)
     current_phonemes = _sanity_check(current_phonemes)
     # print("After sanity check, final output: ", word, " ".join(current_phonemes))
-    return word, current_phonemes
+    return word, tuple(current_phonemes)
 
 
 
@@ -79,15 +98,9 @@ def _sanity_check(phonemes: list):
     # Part 1: There should be at least one intonated vowel in each word
     #         For example, the word 'τους' is written without a tone but it
     #         is implied. so, we need to convert it from 't u0 s' to 't u1 s'.
-    num_of_vowel_phones = len([ph for ph in phonemes if ph in vowel_phonemes])
+    num_of_vowel_phones = sum(ph in _vowel_phonemes for ph in phonemes)
     if num_of_vowel_phones == 1:  # if word is τους then we need intonation at t u1 s
-        new_phonemes = []
-        for ph in phonemes:
-            if ph in vowel_phonemes:
-                new_phonemes.append(ph.replace("0", "1"))  # add intonation
-            else:
-                new_phonemes.append(ph)
-        phonemes = new_phonemes
+        phonemes = [ph.replace("0", "1") if ph in _vowel_phonemes else ph for ph in phonemes]  # add intonation
     # Part 2: In Greek we do not have consecutive consonant sounds (of the same consonant).
     #         For example, we can't have a1 n n a0, this will need to be converted to a1 n a0
     ph_id = 0
@@ -114,21 +127,23 @@ def _check_till_dipthongs(word):
     phons = []
     counter = 0
     while counter < len(word_couples):
-        if word_couples[counter] in diphthong_rules.keys():
+        # A single probe per couple (all diphthongs are 2 characters long, so the dict is all we need to match them)
+        diphthong_phonemes = _diphthong_phonemes.get(word_couples[counter])
+        if diphthong_phonemes is not None:
             if len(phons) > 0: del phons[-1]
-            phons.append(diphthong_rules[word_couples[counter]])
+            phons.extend(diphthong_phonemes)
             if counter + 1 < len(word_couples):
                 word_couples[counter + 1] = word_couples[counter+1][-1]  # convert 'ια' to 'α' since 'ι' is being used by the previous dipthong
         else:
             for val in word_couples[counter]:
                 try:
-                    phons.append(character_rules[val])
+                    phons.extend(_character_phonemes[val])
                 except KeyError as e:
                     print("Key not found in single character rules: {}.".format(str(e)))
                     continue
             if counter + 1 < len(word_couples): 
                 # in order to avoid duplicates
-                if word_couples[counter+1] not in diphthong_rules.keys(): word_couples[counter+1] = word_couples[counter+1][1]
+                if word_couples[counter+1] not in diphthong_rules: word_couples[counter+1] = word_couples[counter+1][1]
         counter += 1
     return word, phons
 
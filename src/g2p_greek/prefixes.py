@@ -78,6 +78,7 @@ _prefixes['4digit'].update({key: (_plural_forms[key] + " χιλιάδες").stri
 #   and convert them to 10000, 11000, 12000, 20000, ..., 90000
 _prefixes['5digit'] = {key + "000": val + " χιλιάδες" for key, val in _prefixes['2digit'].items() if len(key) > 1}
 
-# Update for 6 digits. Replace "διακόσια" with "διακόσιες" in order to bring to plural form
-_prefixes['6digit'] = {key + "000": val[:-2] + "ιες" + " χιλιάδες" for key, val in _prefixes['3digit'].items()}
+# Update for 6 digits. Replace "διακόσια" with "διακόσιες" in order to bring to plural form (100 stays "εκατό")
+_prefixes['6digit'] = {key + "000": (val if key == "100" else val[:-2] + "ιες") + " χιλιάδες"
+                       for key, val in _prefixes['3digit'].items() if len(key) == 3}
 
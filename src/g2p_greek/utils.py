@@ -29,6 +29,9 @@ import json
 
 punctuation = [";", "!", ":", "∙", "»", ","]
 
+_whitespace_pattern = re.compile(r"\s+")
+_bullets_pattern = re.compile(r"•|∙|»")
+
 
 def _read_in_chunks(file_object, chunk_size=2048):
     """ Lazy function to read a file piece by piece. Useful for big files.
@@ -80,7 +83,7 @@ def handle_commas(word: str, comma_symbol=",") -> str:
             else:
                 word = word.replace(comma_symbol, "")
         else:
-            word = re.sub(r"\s+", " ", word)
+            word = _whitespace_pattern.sub(" ", word)
             # --------------- Start ignore spaces ---------------
             # So, for example, if word == 102 , 98 then convert it to 102, 98 and then to 102,98 (remove spaces)
             if word[comma_index-1] == " ":
@@ -108,6 +111,10 @@ def handle_commas(word: str, comma_symbol=",") -> str:
     return word
 
 
+_hour_pattern = re.compile(r"(\d+):(\d+)")
+_special_minutes = {"15": "τέταρτο", "30": "μισή"}
+
+
 def handle_hours(word: str):
     # We will assume that the word is an hour if it contains a ":"
     # For example, convert 10:45 to 10 και 45
@@ -116,16 +123,13 @@ def handle_hours(word: str):
     #   8:30  -> 8 και μιση (and not οχτωμιση)
     if ":" not in word:
         return word
-    parts = word.split(":")
-    if len(parts) != 2 or "" in parts or (not (parts[0].isdigit() and parts[1].isdigit())):
+    match = _hour_pattern.fullmatch(word)
+    if match is None:
         # Just ignore the ':'
-        return re.sub(":", " ", word).strip()
-    word = re.sub(":", " και ", word)
-    if parts[1] == "15":
-        word = re.sub("15", "τέταρτο", word)
-    elif parts[1] == "30":
-        word = re.sub("30", "μισή", word)
-    return word
+        return word.replace(":", " ").strip()
+    hours, minutes = match.groups()
+    # Only the minutes are converted (e.g. 15:15 -> 15 και τέταρτο)
+    return hours + " και " + _special_minutes.get(minutes, minutes)
 
 
 def process_word(word: str, basic_substitutes: dict = None, punctuation_to_keep = [],
@@ -151,17 +155,15 @@ def process_word(word: str, basic_substitutes: dict = None, punctuation_to_keep
         if (key in word.lower().split()) or (key in word.lower().split(".")):
             if key == "$": key = "\$"
             word = re.sub(key, " " + val + " ", word.lower().strip())
-    word = re.sub(r"\.", " . ", word)
-    word = re.sub(r"\?", " ? ", word)
-    word = re.sub(r"•|∙|»", " ", word)
+    word = word.replace(".", " . ").replace("?", " ? ")
+    word = _bullets_pattern.sub(" ", word)
     if keep_only_chars_and_digits:
         word = re.sub(r"[^\w\d{}]".format("".join(punctuation_to_keep)), " ", word)  # Keep only characters and digits
     else:
-        word = re.sub(r"\n", " \n ", word)
-        word = re.sub(r"\t", " \t ", word)
+        word = word.replace("\n", " \n ").replace("\t", " \t ")
         for char in punctuation:
-            word = re.sub(char, " " + char + " ", word)
-    word = re.sub(r"\s+", " ", word).strip()  # Remove redundant spaces
+            word = word.replace(char, " " + char + " ")
+    word = _whitespace_pattern.sub(" ", word).strip()  # Remove redundant spaces
     return word
 
 
@@ -0,0 +1,109 @@
+"""Test cases for the dictionary module."""
+import os
+
+import pytest
+
+from g2p_greek import dictionary
+from g2p_greek.dictionary import Dictionary
+
+
+LEXICON = "καλημέρα k a0 l i0 m e1 r a0\nκαι k e1\n"
+
+
+@pytest.fixture
+def lexicon_path(tmp_path) -> str:
+    """Fixture for a small lexicon file."""
+    path = tmp_path / "lexicon.dic"
+    path.write_text(LEXICON, encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def cache_dir(tmp_path) -> str:
+    """Fixture for the lexicon cache directory (created by the Dictionary)."""
+    return str(tmp_path / "cache")
+
+
+def _cache_files(cache_dir: str) -> list:
+    return sorted(os.listdir(cache_dir)) if os.path.isdir(cache_dir) else []
+
+
+def test_lexicon_is_not_cached_by_default(lexicon_path, tmp_path) -> None:
+    """It does not write anything if no cache directory is given."""
+    lexicon = Dictionary(lexicon_path)
+    assert lexicon.get_word_phonemes("και") == "και k e1\n"
+    assert sorted(os.listdir(tmp_path)) == ["lexicon.dic"]
+
+
+def test_lexicon_cache_hit(lexicon_path, cache_dir, monkeypatch) -> None:
+    """It loads the lexicon from the cache without parsing it again."""
+    expected = Dictionary(lexicon_path, cache_dir=cache_dir).lexicon_dict
+    assert [name.endswith(".lexicon") for name in _cache_files(cache_dir)] == [True]
+
+    def fail(path_to_lexicon):
+        raise AssertionError("The lexicon was parsed again")
+
+    monkeypatch.setattr(Dictionary, "_lexicon_lookup", staticmethod(fail))
+    assert Dictionary(lexicon_path, cache_dir=cache_dir).lexicon_dict == expected
+
+
+def test_lexicon_cache_is_stale(lexicon_path, cache_dir) -> None:
+    """It parses the lexicon again if the lexicon file changed."""
+    Dictionary(lexicon_path, cache_dir=cache_dir)
+    with open(lexicon_path, "a", encoding="utf-8") as fw:
+        fw.write("ένα e1 n a0\n")
+    lexicon = Dictionary(lexicon_path, cache_dir=cache_dir)
+    assert lexicon.lexicon_dict["ένα"] == "e1 n a0"
+    # The cache is replaced, not duplicated
+    assert len(_cache_files(cache_dir)) == 1
+    assert Dictionary(lexicon_path, cache_dir=cache_dir).lexicon_dict["ένα"] == "e1 n a0"
+
+
+def test_lexicon_cache_is_corrupted(lexicon_path, cache_dir) -> None:
+    """It ignores and replaces a corrupted cache file."""
+    Dictionary(lexicon_path, cache_dir=cache_dir)
+    (cache_file,) = _cache_files(cache_dir)
+    with open(os.path.join(cache_dir, cache_file), "wb") as fw:
+        fw.write(b"not a lexicon")
+    assert Dictionary(lexicon_path, cache_dir=cache_dir).lexicon_dict["και"] == "k e1"
+    with open(os.path.join(cache_dir, cache_file), "rb") as fr:
+        assert fr.read() != b"not a lexicon"
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="file owners are POSIX only")
+def test_lexicon_cache_of_another_user(lexicon_path, cache_dir, monkeypatch) -> None:
+    """It does not load a cache file that belongs to another user."""
+    Dictionary(lexicon_path, cache_dir=cache_dir)
+    parsed = []
+    lexicon_lookup = Dictionary._lexicon_lookup
+
+    def lookup(path_to_lexicon):
+        parsed.append(path_to_lexicon)
+        return lexicon_lookup(path_to_lexicon)
+
+    monkeypatch.setattr(Dictionary, "_lexicon_lookup", staticmethod(lookup))
+    monkeypatch.setattr(os, "getuid", lambda: os.stat(cache_dir).st_uid + 1)
+    assert Dictionary(lexicon_path, cache_dir=cache_dir).lexicon_dict["και"] == "k e1"
+    assert parsed == [os.path.abspath(lexicon_path)]
+
+
+def test_lexicon_cache_dir_is_not_writable(lexicon_path, tmp_path) -> None:
+    """It warns and still returns the lexicon if the cache cannot be created."""
+    not_a_dir = tmp_path / "file"
+    not_a_dir.write_text("", encoding="utf-8")
+    with pytest.warns(RuntimeWarning, match="Could not cache the lexicon"):
+        lexicon = Dictionary(lexicon_path, cache_dir=str(not_a_dir / "cache"))
+    assert lexicon.lexicon_dict["καλημέρα"] == "k a0 l i0 m e1 r a0"
+
+
+def test_lexicon_cache_failed_write(lexicon_path, cache_dir, monkeypatch) -> None:
+    """It removes the temporary file if the cache could not be written."""
+
+    def fail(src, dst):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(dictionary.os, "replace", fail)
+    with pytest.warns(RuntimeWarning, match="No space left on device"):
+        lexicon = Dictionary(lexicon_path, cache_dir=cache_dir)
+    assert lexicon.lexicon_dict["και"] == "k e1"
+    assert _cache_files(cache_dir) == []
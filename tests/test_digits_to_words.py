@@ -0,0 +1,91 @@
+"""Test cases for the digits_to_words module."""
+import pytest
+
+from g2p_greek.digits_to_words import convert_kaldi_text
+from g2p_greek.digits_to_words import convert_numbers
+from g2p_greek.digits_to_words import convert_sentence
+
+
+@pytest.mark.parametrize("number", ["0000", "00000", "000000"])
+def test_convert_numbers_all_zero_groups(number: str) -> None:
+    """It produces nothing for groups that only contain zeros."""
+    assert convert_numbers(number) == ""
+
+
+@pytest.mark.parametrize(
+    "number, expected",
+    [
+        ("1000000", "ένα εκατομμύριο"),
+        ("1000000000", "ένα δισεκατομμύριο"),
+        ("2000000", "δύο εκατομμύρια"),
+        ("1000001", "ένα εκατομμύριο ένα"),
+        ("2001000", "δύο εκατομμύρια χίλια"),
+    ],
+)
+def test_convert_numbers_millions(number: str, expected: str) -> None:
+    """It joins the groups of large numbers without extra spaces."""
+    assert convert_numbers(number) == expected
+
+
+@pytest.mark.parametrize(
+    "number, expected",
+    [
+        ("0000000000", ""),
+        ("0001000000", "ένα εκατομμύριο"),
+        (
+            "0033146541",
+            "τριαντατρία εκατομμύρια εκατόν σαρανταέξι χιλιάδες πεντακοσια σαρανταένα",
+        ),
+        ("1001000000", "ένα δισεκατομμύριο ένα εκατομμύριο"),
+        ("2001000000", "δύο δισεκατομμύρια ένα εκατομμύριο"),
+    ],
+)
+def test_convert_numbers_large_scales(number: str, expected: str) -> None:
+    """It skips the leading zero groups and reads each scale group by group."""
+    assert convert_numbers(number) == expected
+
+
+def test_convert_sentence() -> None:
+    """It converts the numbers of a sentence to lowercase words."""
+    assert convert_sentence("Έχω 100 ευρώ, είναι2") == "έχω εκατό ευρώ είναι δύο"
+
+
+def test_convert_sentence_to_lower_is_deprecated() -> None:
+    """It warns when the no-op to_lower argument is used."""
+    with pytest.deprecated_call():
+        assert convert_sentence("ΑΒΓ 100", to_lower=False) == "αβγ εκατό"
+
+
+@pytest.mark.parametrize(
+    "number, expected",
+    [
+        ("0", "μηδέν"),
+        ("13", "δεκατρία"),
+        ("21", "εικοσιένα"),
+        ("1000", "χίλια"),
+        ("2000", "δυο χιλιάδες"),
+        ("100000", "εκατό χιλιάδες"),
+        ("200001", "διακόσιες χιλιάδες ένα"),
+    ],
+)
+def test_convert_numbers_up_to_six_digits(number: str, expected: str) -> None:
+    """It spells out the numbers of up to six digits."""
+    assert convert_numbers(number) == expected
+
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_convert_kaldi_text(tmp_path, num_workers: int) -> None:
+    """It writes the same lines with one and with many processes."""
+    kaldi_text = tmp_path / "text"
+    kaldi_text.write_text(
+        "".join(f"utt{i} Είναι {i} και {i * 1000}\n" for i in range(50)),
+        encoding="utf-8",
+    )
+    out_path = tmp_path / "new_text"
+    new_lines = convert_kaldi_text(
+        str(kaldi_text), out_path=str(out_path), num_workers=num_workers
+    )
+    assert len(new_lines) == 50
+    assert new_lines[1] == "utt1 είναι ένα και χίλια\n"
+    assert new_lines[49] == "utt49 είναι σαρανταεννιά και σαρανταεννιά χιλιάδες\n"
+    assert out_path.read_text(encoding="utf-8") == "".join(new_lines)
@@ -1,7 +1,13 @@
 """Test cases for the __main__ module."""
+from pathlib import Path
+
 import pytest
 
 from g2p_greek import g2p_greek
+from g2p_greek.g2p_greek import G2P
+
+
+SUBSTITUTE_WORDS_PATH = str(Path(__file__).parent / "substitute_words.json")
 
 
 @pytest.fixture
@@ -15,3 +21,57 @@ def test_main_succeeds(runner) -> None:
     # result = runner.invoke(g2p_greek.cmdline)
     # assert result.exit_code == 0
     return
+
+
+@pytest.fixture
+def g2p() -> G2P:
+    """Fixture for a G2P object in test mode."""
+    return G2P(test_mode=True, substitute_words_path=SUBSTITUTE_WORDS_PATH)
+
+
+def test_convert_test_word_substitutes_words(g2p) -> None:
+    """It substitutes the words of the substitute words file."""
+    assert g2p.convert_test_word("ok") == ["οκέι o0 k e1 i0\n"]
+
+
+def test_convert_test_word_hours(g2p) -> None:
+    """It only converts the minutes of an hour."""
+    assert g2p.convert_test_word("15:15") == [
+        "δεκαπέντε dh e0 k a0 p e1 d e0\n",
+        "και k e1\n",
+        "τέταρτο t e1 t a0 r t o0\n",
+    ]
+
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_convert_from_lexicon(tmp_path, num_workers: int) -> None:
+    """It writes the same lexicon with one and with many processes."""
+    words_txt = tmp_path / "words.txt"
+    words_txt.write_text(
+        "".join(f"λέξη{i}\nκαλημέρα\n" for i in range(100)), encoding="utf-8"
+    )
+    lexicon = tmp_path / "lexicon.dic"
+    lexicon.write_text("καλημέρα k a0 l i0 m e1 r a0\n", encoding="utf-8")
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    out_lines = G2P(
+        str(words_txt),
+        str(out_dir),
+        lexicon_path=str(lexicon),
+        substitute_words_path=SUBSTITUTE_WORDS_PATH,
+        num_workers=num_workers,
+    ).convert_from_lexicon()
+    # Duplicates are removed and the lines keep the order of the words
+    assert out_lines[:4] == [
+        "λέξη l e1 k s i0\n",
+        "μηδέν m i0 dh e1 n\n",
+        "καλημέρα k a0 l i0 m e1 r a0\n",
+        "ένα e1 n a0\n",
+    ]
+    assert len(out_lines) == len(set(out_lines))
+    assert (out_dir / "words.txt").read_text(encoding="utf-8") == "".join(out_lines)
+
+
+def test_convert_test_word_latin_groups(g2p) -> None:
+    """It converts the multi-letter latin mappings before the single letters."""
+    assert g2p.convert_test_word("thing") == ["thing th i1 n gh\n"]
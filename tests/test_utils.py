@@ -0,0 +1,18 @@
+"""Test cases for the utils module."""
+import pytest
+
+from g2p_greek.utils import handle_hours
+
+
+@pytest.mark.parametrize(
+    "word, expected",
+    [
+        ("15:15", "15 και τέταρτο"),
+        ("15:30", "15 και μισή"),
+        ("10:20", "10 και 20"),
+        ("λέξη", "λέξη"),
+    ],
+)
+def test_handle_hours(word: str, expected: str) -> None:
+    """It only converts the minutes of an hour."""
+    assert handle_hours(word) == expected